@@ -1,9 +1,21 @@
-import face_recognition
 import numpy as np
 from PIL import Image
 import os
 from typing import List, Tuple, Dict
-import cv2
+
+# face_recognition (dlib + its models) is heavy to import, so it is loaded
+# on first use or during the startup warmup rather than at module load.
+_face_recognition = None
+
+
+def _get_face_recognition():
+    """Import face_recognition on first use and cache the module"""
+    global _face_recognition
+    if _face_recognition is None:
+        import face_recognition
+        _face_recognition = face_recognition
+    return _face_recognition
+
 
 class FaceRecognitionService:
     """Service for face detection and recognition"""
@@ -17,6 +29,18 @@ class FaceRecognitionService:
         """
         self.tolerance = tolerance
     
+    def warmup(self):
+        """
+        Load the face recognition models ahead of the first request
+        
+        Importing face_recognition loads the dlib models; running detection
+        and encoding on a blank image initialises the rest of the pipeline.
+        """
+        face_recognition = _get_face_recognition()
+        image = np.zeros((64, 64, 3), dtype=np.uint8)
+        face_recognition.face_locations(image)
+        face_recognition.face_encodings(image, [(8, 56, 56, 8)])
+    
     def detect_faces(self, image_path: str) -> List[np.ndarray]:
         """
         Detect all faces in an image and return their encodings
@@ -28,6 +52,8 @@ class FaceRecognitionService:
             List of face encodings (128-dimensional vectors)
         """
         try:
+            face_recognition = _get_face_recognition()
+            
             # Load image
             image = face_recognition.load_image_file(image_path)
             
@@ -87,7 +113,7 @@ class FaceRecognitionService:
             return False, 0.0
         
         # Calculate face distances
-        face_distances = face_recognition.face_distance(known_encodings, unknown_encoding)
+        face_distances = _get_face_recognition().face_distance(known_encodings, unknown_encoding)
         
         # Get the best match
         best_match_index = np.argmin(face_distances)
@@ -1,16 +1,18 @@
 from fastapi import FastAPI, File, UploadFile, Depends, HTTPException, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, List, Optional
 import shutil
 import os
 from datetime import datetime
 import uuid
+import threading
 from passlib.context import CryptContext
 import json
+import numpy as np
 
-from models import Person, Photo, ReferencePhoto, Event, get_db, init_db, photo_person
+from models import Person, Photo, ReferencePhoto, Event, SessionLocal, get_db, init_db, photo_person
 from face_recognition_service import FaceRecognitionService, validate_image
 from pydantic import BaseModel
 
@@ -40,6 +42,66 @@ THUMBNAIL_DIR = os_module.getenv("THUMBNAIL_DIR", "/tmp/uploads/thumbnails")
 os_module.makedirs(UPLOAD_DIR, exist_ok=True)
 os_module.makedirs(FACES_DIR, exist_ok=True)
 os_module.makedirs(THUMBNAIL_DIR, exist_ok=True)
+
+# Warmup - preload face models and the embedding gallery in the background
+WARMUP_ON_STARTUP = os_module.getenv("WARMUP_ON_STARTUP", "true").lower() in ("1", "true", "yes")
+
+warmup_status = {
+    "state": "pending",  # pending, running, ready, skipped, failed
+    "started_at": None,
+    "finished_at": None,
+    "people_loaded": 0,
+    "error": None
+}
+
+# Enrolled face encodings keyed by person_id, built once and kept in sync on enrollment
+people_encodings_cache: Optional[Dict[int, List[np.ndarray]]] = None
+people_encodings_lock = threading.Lock()
+
+
+def load_people_encodings(db: Session) -> Dict[int, List[np.ndarray]]:
+    """Return encodings of all enrolled people, building the cache on first use"""
+    global people_encodings_cache
+    with people_encodings_lock:
+        if people_encodings_cache is None:
+            people = db.query(Person).filter(Person.face_embeddings.isnot(None)).all()
+            
+            encodings_by_person = {}
+            for person in people:
+                encodings = person.get_face_embeddings()
+                if encodings:
+                    encodings_by_person[person.id] = [np.array(enc) for enc in encodings]
+            
+            people_encodings_cache = encodings_by_person
+        return people_encodings_cache
+
+
+def update_person_encodings(person: Person):
+    """Refresh a single person's entry in the encodings cache"""
+    with people_encodings_lock:
+        if people_encodings_cache is not None:
+            people_encodings_cache[person.id] = [np.array(enc) for enc in person.get_face_embeddings()]
+
+
+def run_warmup():
+    """Load face recognition models and the embedding gallery"""
+    warmup_status["state"] = "running"
+    warmup_status["started_at"] = datetime.utcnow().isoformat()
+    
+    db = SessionLocal()
+    try:
+        face_service.warmup()
+        warmup_status["people_loaded"] = len(load_people_encodings(db))
+        warmup_status["state"] = "ready"
+        print("✅ Warmup complete!")
+    except Exception as e:
+        print(f"Error during warmup: {e}")
+        warmup_status["state"] = "failed"
+        warmup_status["error"] = str(e)
+    finally:
+        db.close()
+        warmup_status["finished_at"] = datetime.utcnow().isoformat()
+
 # Pydantic models for request/response
 class UserRegister(BaseModel):
     name: str
@@ -68,8 +130,15 @@ class PersonResponse(BaseModel):
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database on startup"""
+    """Initialize database on startup and start the warmup in the background"""
     init_db()
+    
+    if WARMUP_ON_STARTUP:
+        # Run in a thread so light endpoints are served while models load
+        threading.Thread(target=run_warmup, daemon=True).start()
+    else:
+        warmup_status["state"] = "skipped"
+    
     print("✅ Server started successfully!")
 
 
@@ -78,6 +147,16 @@ async def root():
     return {"message": "Smart Photo Share API", "status": "running"}
 
 
+@app.get("/api/ready")
+async def readiness():
+    """Report warmup status; 503 until face recognition is ready to serve"""
+    ready = warmup_status["state"] in ("ready", "skipped")
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"ready": ready, **warmup_status}
+    )
+
+
 # --- User Management ---
 
 @app.post("/api/register")
@@ -173,6 +252,7 @@ async def enroll_face(
         raise HTTPException(status_code=400, detail="No faces detected in uploaded photos")
     
     db.commit()
+    update_person_encodings(person)
     
     return {
         "message": f"Successfully enrolled {enrolled_count} face samples",
@@ -241,15 +321,7 @@ async def process_photos(db: Session = Depends(get_db)):
     Process all pending photos: detect faces and match with enrolled people
     """
     # Get all people with face encodings
-    people = db.query(Person).filter(Person.face_embeddings.isnot(None)).all()
-    
-    people_encodings = {}
-    for person in people:
-        encodings = person.get_face_embeddings()
-        if encodings:
-            # Convert back to numpy arrays
-            import numpy as np
-            people_encodings[person.id] = [np.array(enc) for enc in encodings]
+    people_encodings = load_people_encodings(db)
     
     # Get pending photos
     pending_photos = db.query(Photo).filter(Photo.processed == 0).all()